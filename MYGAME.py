@@ -2,8 +2,17 @@ import tkinter as tk
 from tkinter import messagebox
 import random
 import os
+import sys
 import time
 import re
+import atexit
+import glob
+import json
+from collections import Counter
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from array import array
 
 # --- Global Word Bank (Now replaced by dynamic search) ---
 # BRANDS is removed.
@@ -21,11 +30,462 @@ IMPOSTER_WORDS_POOL = [
     "Object", "Noun", "Business", "Name", "Idea", "Culture"
 ]
 
+FALLBACK_WORDS_POOL = ["Great", "Cool", "Fun", "Shiny", "New", "Old", "Everyday", "Unique"]
+
+# --- Topic Pool and Aliases (Used to match the Imposter's guesses) ---
+TOPIC_POOL = [
+    "Tesla", "Netflix", "ChatGPT", "Fortnite", "Starbucks",
+    "Disney", "Amazon", "YouTube", "Apple", "Spotify"
+]
+
+TOPIC_ALIASES = {
+    "ChatGPT": ["GPT", "OpenAI"],
+    "YouTube": ["YT"],
+    "Amazon": ["Amazon Prime"],
+    "Disney": ["Walt Disney", "Disney Plus"],
+    "Starbucks": ["Starbucks Coffee"],
+    "Tesla": ["Tesla Motors"],
+}
+
+# Optional external word banks (one word per line). When set, these replace the
+# small built-in pools above and can hold 100k+ entries.
+INNOCENT_WORDS_FILE = os.environ.get("IMPOSTER_INNOCENT_WORDS_FILE")
+IMPOSTER_WORDS_FILE = os.environ.get("IMPOSTER_IMPOSTER_WORDS_FILE")
+FALLBACK_WORDS_FILE = os.environ.get("IMPOSTER_FALLBACK_WORDS_FILE")
+
+# Optional extra topics (one per line) added to TOPIC_POOL for guess matching
+TOPICS_FILE = os.environ.get("IMPOSTER_TOPICS_FILE")
+
+# Where in-progress games are checkpointed so they survive a crash or restart
+CHECKPOINT_FILE = os.environ.get(
+    "IMPOSTER_CHECKPOINT_FILE", os.path.join(os.path.expanduser("~"), ".imposter_checkpoint.jsonl")
+)
+
+# Where finished game outcomes are stored for analytics
+OUTCOMES_DIR = os.environ.get(
+    "IMPOSTER_OUTCOMES_DIR", os.path.join(os.path.expanduser("~"), ".imposter_outcomes")
+)
+
+
+# --- Compact Word Bank (Sorted blob + offsets) ---
+
+class WordBank:
+    """
+    A read-only, case-insensitively sorted word list packed into one bytes blob
+    with an array of start offsets. Lookups are binary searches, so per-turn
+    cost does not grow with the size of the bank.
+    """
+
+    def __init__(self, words):
+        # Words that arrive already sorted (as generated bank files are) stream
+        # straight into the blob. The first word out of order switches to
+        # collecting one packed bytes entry per word and sorting those instead.
+        blob = bytearray()
+        offsets = array("I", [0])
+        previous = None
+        packed = None
+        for position, word in enumerate(words):
+            word = word.strip()
+            if not word or len(word.split()) != 1:
+                continue
+            key = word.lower()
+            if packed is None:
+                if previous is None or key > previous:
+                    blob += word.encode("utf-8")
+                    offsets.append(len(blob))
+                    previous = key
+                    continue
+                if key == previous:
+                    continue
+                packed = [self._pack(blob[offsets[i]:offsets[i + 1]].decode("utf-8"), i)
+                          for i in range(len(offsets) - 1)]
+            packed.append(self._pack(word, position))
+
+        if packed is not None:
+            # Entries sort by lowercase key, then by arrival, so the first
+            # spelling seen of each word is the one kept
+            packed.sort()
+            blob = bytearray()
+            offsets = array("I", [0])
+            previous = None
+            for i, entry in enumerate(packed):
+                packed[i] = None
+                key, _, rest = entry.partition(b"\0")
+                if key != previous:
+                    blob += rest[4:]
+                    offsets.append(len(blob))
+                    previous = key
+
+        self._blob = bytes(blob)
+        self._offsets = offsets
+
+    @staticmethod
+    def _pack(word, position):
+        """Packs a word as lowercase key, NUL, arrival position and spelling, so bytes order sorts it."""
+        return word.lower().encode("utf-8") + b"\0" + position.to_bytes(4, "big") + word.encode("utf-8")
+
+    @classmethod
+    def from_file(cls, path):
+        """Loads a word bank from a text file with one word per line."""
+        with open(path, encoding="utf-8") as f:
+            return cls(line for line in f)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("word bank index out of range")
+        return self._blob[self._offsets[index]:self._offsets[index + 1]].decode("utf-8")
+
+    def _key(self, index):
+        return self[index].lower()
+
+    def _lower_bound(self, key):
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def prefix_range(self, prefix):
+        """Returns the (start, end) index range of words starting with prefix."""
+        prefix = prefix.lower()
+        start = self._lower_bound(prefix)
+        # Find the upper bound with a second binary search over the tail
+        lo, hi = start, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid).startswith(prefix):
+                lo = mid + 1
+            else:
+                hi = mid
+        return start, lo
+
+    def words_with_prefix(self, prefix, limit=None):
+        """Returns words starting with prefix (case-insensitive), up to limit."""
+        start, end = self.prefix_range(prefix)
+        if limit is not None:
+            end = min(end, start + limit)
+        return [self[i] for i in range(start, end)]
+
+    def __contains__(self, word):
+        key = word.lower()
+        index = self._lower_bound(key)
+        return index < len(self) and self._key(index) == key
+
+    def random_word(self, exclude=(), avoid_initial=None, attempts=20):
+        """
+        Picks a random word whose lowercase form is not in exclude, optionally
+        skipping every word that starts with avoid_initial. Returns None if no
+        candidate was found within the given number of attempts.
+        """
+        total = len(self)
+        skip_start, skip_end = (0, 0)
+        if avoid_initial:
+            skip_start, skip_end = self.prefix_range(avoid_initial[0])
+        available = total - (skip_end - skip_start)
+        if available <= 0:
+            return None
+
+        for _ in range(attempts):
+            index = random.randrange(available)
+            if index >= skip_start:
+                index += skip_end - skip_start
+            word = self[index]
+            if word.lower() not in exclude:
+                return word
+
+        # Small banks: fall back to an exhaustive scan so nothing valid is missed
+        if available <= attempts * 4:
+            candidates = [self[i] for i in range(total)
+                          if not skip_start <= i < skip_end and self._key(i) not in exclude]
+            if candidates:
+                return random.choice(candidates)
+        return None
+
+
+_word_banks = {}
+
+def get_word_bank(name, io=None):
+    """Lazily builds (and caches) the word bank for 'INNOCENT', 'IMPOSTER' or 'FALLBACK'."""
+    io = resolve_console_io(io)
+    if name not in _word_banks:
+        sources = {
+            "INNOCENT": (INNOCENT_WORDS_FILE, INNOCENT_WORDS_POOL),
+            "IMPOSTER": (IMPOSTER_WORDS_FILE, IMPOSTER_WORDS_POOL),
+            "FALLBACK": (FALLBACK_WORDS_FILE, FALLBACK_WORDS_POOL),
+        }
+        path, default_pool = sources[name]
+        if path:
+            try:
+                _word_banks[name] = WordBank.from_file(path)
+            except (OSError, UnicodeDecodeError) as e:
+                io.print(f"Error loading word bank '{path}': {e}. Falling back to built-in words.")
+                _word_banks[name] = WordBank(default_pool)
+        else:
+            _word_banks[name] = WordBank(default_pool)
+    return _word_banks[name]
+
+
+# --- Fuzzy Matching (Alias index with trigram lookup for typos) ---
+
+def normalize_word(text):
+    """Lowercases and drops spaces/punctuation, so 'Chat GPT' and 'chatgpt' compare equal."""
+    return re.sub(r'[^0-9a-z]', '', text.lower())
+
+
+def word_stem(text):
+    """
+    Normalized word without a plural or -s/-es/-ed/-ing ending, so 'Games',
+    'Gamed' and 'Gaming' all share the stem of 'Game' (and 'House'/'Horse' don't).
+    """
+    stem = normalize_word(text)
+    for suffix in ("ing", "es", "ed", "s"):
+        if stem.endswith(suffix) and len(stem) - len(suffix) >= 3 and not (suffix == "s" and stem.endswith("ss")):
+            stem = stem[:-len(suffix)]
+            break
+    # 'stopped' -> 'stop', 'glasses' -> 'glas' (as for 'glass'), 'gaming' -> 'gam' (as for 'game')
+    if len(stem) > 3 and stem[-1] == stem[-2] and stem[-1] not in "aeiou0123456789":
+        stem = stem[:-1]
+    if len(stem) > 3 and stem.endswith("e"):
+        stem = stem[:-1]
+    return stem
+
+
+def edit_distance(a, b, max_distance=None):
+    """
+    Edit distance between two strings, counting a swap of neighbouring letters
+    as one edit. With max_distance, stops early once the result must exceed it.
+    """
+    before_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i]
+        for j in range(1, len(b) + 1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cost = min(cost, before_previous[j - 2] + 1)
+            current.append(cost)
+        if max_distance is not None and min(current) > max_distance and min(previous) > max_distance:
+            return max_distance + 1
+        before_previous, previous = previous, current
+    return previous[-1]
+
+
+def typo_tolerance(key):
+    """How many edits still count as the same word: none for short words, more for long ones."""
+    if len(key) < 5:
+        return 0
+    return 1 if len(key) < 9 else 2
+
+
+def word_trigrams(key):
+    """Distinct 3-letter slices of a normalized word, padded so the ends count too."""
+    padded = f"^^{key}$$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class FuzzyIndex:
+    """
+    Maps normalized words and aliases to a canonical entry. Exact (normalized)
+    hits are a dict lookup; near misses go through a trigram index, so only
+    entries sharing enough trigrams with the text are compared by edit distance.
+    Word forms ('Streams' for 'Stream') are looked up by stem instead.
+    """
+
+    def __init__(self, entries=(), aliases=None):
+        self._exact = {}     # normalized key -> canonical entry
+        self._stems = {}     # word stem -> canonical entry
+        self._keys = []      # key id -> normalized key
+        self._trigrams = {}  # trigram -> list of key ids
+        aliases = aliases or {}
+        for entry in entries:
+            self.add(entry, aliases.get(entry, ()))
+
+    def add(self, entry, aliases=()):
+        for text in (entry, *aliases):
+            key = normalize_word(text)
+            if not key or key in self._exact:
+                continue
+            self._exact[key] = entry
+            self._stems.setdefault(word_stem(key), entry)
+            key_id = len(self._keys)
+            self._keys.append(key)
+            for trigram in word_trigrams(key):
+                self._trigrams.setdefault(trigram, []).append(key_id)
+
+    def _candidates(self, key, tolerance):
+        trigrams = word_trigrams(key)
+        # Each edit (a swap included) breaks at most 4 trigrams, so a match shares at least this many
+        needed = len(trigrams) - 4 * tolerance
+        if needed <= 0:
+            return [i for i, k in enumerate(self._keys) if abs(len(k) - len(key)) <= tolerance]
+
+        # A match must share one of the rarest (len - needed + 1) trigrams, so only those
+        # posting lists are read; each candidate's real overlap is checked afterwards
+        postings = sorted((self._trigrams.get(t, ()) for t in trigrams), key=len)
+        candidates = set(chain.from_iterable(postings[:len(postings) - needed + 1]))
+        return [i for i in candidates
+                if abs(len(self._keys[i]) - len(key)) <= tolerance
+                and len(trigrams & word_trigrams(self._keys[i])) >= needed]
+
+    def match(self, text):
+        """Returns the canonical entry text refers to, or None if nothing (or several entries) is close enough."""
+        key = normalize_word(text)
+        if key in self._exact:
+            return self._exact[key]
+
+        tolerance = typo_tolerance(key)
+        if not tolerance:
+            return None
+
+        best_distance, best_entries = tolerance + 1, set()
+        for key_id in self._candidates(key, tolerance):
+            candidate = self._keys[key_id]
+            distance = edit_distance(key, candidate, tolerance)
+            if distance > tolerance:
+                continue
+            if distance < best_distance:
+                best_distance, best_entries = distance, {self._exact[candidate]}
+            elif distance == best_distance:
+                best_entries.add(self._exact[candidate])
+
+        # An equally close match to two different entries is too ambiguous to count
+        return best_entries.pop() if len(best_entries) == 1 else None
+
+    def variant_of(self, text):
+        """
+        Returns the entry text is another form of (same normalized word, or only
+        a plural or -s/-es/-ed/-ing ending apart), or None. Unlike match(), typos
+        do not count: 'Horse' is a different clue from 'House'.
+        """
+        key = normalize_word(text)
+        if key in self._exact:
+            return self._exact[key]
+        return self._stems.get(word_stem(key))
+
+    def __contains__(self, text):
+        return self.variant_of(text) is not None
+
+
+_topic_index = None
+
+def get_topic_index(secret_word=None, io=None):
+    """Returns the shared topic index, making sure secret_word (e.g. a live search result) is in it."""
+    global _topic_index
+    io = resolve_console_io(io)
+    if _topic_index is None:
+        topics = list(TOPIC_POOL)
+        if TOPICS_FILE:
+            try:
+                with open(TOPICS_FILE, encoding="utf-8") as f:
+                    file_topics = [line.strip() for line in f if line.strip()]
+                topics.extend(file_topics)
+            except (OSError, UnicodeDecodeError) as e:
+                io.print(f"Error loading topics '{TOPICS_FILE}': {e}. Using built-in topics.")
+        _topic_index = FuzzyIndex(topics, TOPIC_ALIASES)
+    if secret_word and normalize_word(secret_word) not in _topic_index._exact:
+        _topic_index.add(secret_word, TOPIC_ALIASES.get(secret_word, ()))
+    return _topic_index
+
+
+def is_correct_guess(guess, secret_word, io=None):
+    """True if the guess names the secret word, allowing aliases, spacing and small typos."""
+    if guess.strip().lower() == secret_word.lower():
+        return True
+    return get_topic_index(secret_word, io).match(guess) == secret_word
+
+
+# --- Console I/O (Injectable streams for the console modes) ---
+
+# ANSI escapes: clear the visible screen, wipe the scrollback, move to the top-left
+ANSI_CLEAR_SCREEN = "\x1b[2J\x1b[3J\x1b[H"
+
+class ConsoleIO:
+    """
+    Routes all console-mode input and output through a reader and writer stream
+    so games can be driven by scripts instead of a real terminal.
+
+    Output is buffered and written as one frame whenever the game waits for
+    input, pauses, or clears the screen, instead of one write per print.
+    """
+
+    def __init__(self, reader=None, writer=None, sleep=time.sleep):
+        self.reader = reader
+        self.writer = writer
+        self._sleep = sleep
+        self._frame = []
+
+    def _writer(self):
+        return self.writer or sys.stdout
+
+    def print(self, *args, sep=" ", end="\n"):
+        self._frame.append(sep.join(str(a) for a in args) + end)
+
+    def flush(self):
+        """Writes the buffered frame to the writer in a single call."""
+        if self._frame:
+            writer = self._writer()
+            writer.write("".join(self._frame))
+            self._frame = []
+            writer.flush()
+
+    def clear_screen(self):
+        """
+        Hides everything printed so far. Any buffered output is written first,
+        then terminals get an ANSI clear that also wipes the scrollback; other
+        streams get blank-line padding.
+        """
+        self.flush()
+        writer = self._writer()
+        is_terminal = hasattr(writer, "isatty") and writer.isatty()
+        self._frame.append(ANSI_CLEAR_SCREEN if is_terminal else "\n" * 50)
+        self.flush()
+
+    def sleep(self, seconds):
+        self.flush()
+        self._sleep(seconds)
+
+    def input(self, prompt=""):
+        if self.reader is None and self.writer is None:
+            # Real terminal: keep the builtin for line editing support
+            self.flush()
+            return input(prompt)
+        self.print(prompt, end="")
+        self.flush()
+        line = (self.reader or sys.stdin).readline()
+        if not line:
+            raise EOFError("console reader is exhausted")
+        return line.rstrip("\n")
+
+
+_default_console_io = None
+
+def resolve_console_io(io):
+    """Returns io, or the shared ConsoleIO bound to the real terminal when io is None."""
+    global _default_console_io
+    if io is not None:
+        return io
+    if _default_console_io is None:
+        _default_console_io = ConsoleIO()
+        if os.name == "nt":
+            os.system("")  # Enables ANSI escape handling in the Windows console
+        atexit.register(_default_console_io.flush)
+    return _default_console_io
+
+
 # --- Tool Integration Functions (New) ---
 
-def get_random_trending_topic():
+def get_random_trending_topic(io=None):
     """Uses Google Search to get a random, current, and popular topic/brand."""
-    print("Fetching random secret word from current popular topics...")
+    io = resolve_console_io(io)
+    io.print("Fetching random secret word from current popular topics...")
     try:
         # Search for a list of current trends/brands/topics
         search_result = google_search.search(queries=["current popular brands or trending topics 2024"])
@@ -44,14 +504,20 @@ def get_random_trending_topic():
                 # Select a random word/phrase
                 return random.choice(keywords)
 
-        print("Warning: Could not extract a clean list of trending topics. Falling back to default.")
+        io.print("Warning: Could not extract a clean list of trending topics. Falling back to default.")
         return random.choice(["Tesla", "Netflix", "ChatGPT", "Fortnite", "Starbucks"]) # Fallback to a well-known topic
     except Exception as e:
-        print(f"Error fetching topic: {e}. Falling back to default.")
+        io.print(f"Error fetching topic: {e}. Falling back to default.")
         return random.choice(["Disney", "Amazon", "YouTube", "Apple", "Spotify"]) # Fallback to a well-known topic
 
-def get_word_description(word):
+_description_cache = {}
+
+def get_word_description(word, io=None):
     """Uses Google Search to get a brief, one-line description of the secret word."""
+    io = resolve_console_io(io)
+    # Successful lookups are kept for the life of the process (help hints, rematches)
+    if word in _description_cache:
+        return _description_cache[word]
     try:
         search_result = google_search.search(queries=[f"one sentence description of {word}"])
         
@@ -63,25 +529,27 @@ def get_word_description(word):
                 description = match.group(0).strip()
                 # Clean up source mentions if present (e.g., "Wikipedia says...")
                 if len(description) > 10 and len(description) < 200:
+                    _description_cache[word] = description
                     return description
             
             # Fallback: just return the first chunk of text
-            return text[:200].replace('\n', ' ').strip() + "..."
+            _description_cache[word] = text[:200].replace('\n', ' ').strip() + "..."
+            return _description_cache[word]
             
         return "No specific description found."
     except Exception as e:
-        print(f"Error fetching description: {e}")
+        io.print(f"Error fetching description: {e}")
         return "A popular entity or concept recently mentioned online."
 
 
 # --- Helper Function for Innocent "Help" (Updated to use live search) ---
-def get_secret_word_help(secret_word):
+def get_secret_word_help(secret_word, io=None):
     """
     Provides 3 random, clean, unique words from a live search description 
     of the secret word.
     """
     # Perform a dedicated search for description/context
-    description = get_word_description(secret_word)
+    description = get_word_description(secret_word, io)
     
     # 1. Clean the description and split into words
     cleaned_description = re.sub(r'[^\w\s]', '', description.lower())
@@ -103,35 +571,33 @@ def get_secret_word_help(secret_word):
 
 # --- Shared AI/MIX Logic (No changes to functions that rely on AI logic) ---
 
-def generate_ai_response(player_data, secret_word, used_words):
+def generate_ai_response(player_data, secret_word, used_words, io=None):
     """Generates a unique ONE-WORD response for the AI players, avoiding used words."""
+    io = resolve_console_io(io)
     role = player_data['role']
-    secret_word_lower = secret_word.lower()
+    # Same rule the human players get: no other forms of used words, the secret or its aliases
+    excluded_words = FuzzyIndex(used_words)
+    excluded_words.add(secret_word, TOPIC_ALIASES.get(secret_word, ()))
     
-    # 1. Select the relevant pool based on role
+    # 1. Select the relevant bank based on role
     if role == "INNOCENT":
-        primary_pool = INNOCENT_WORDS_POOL
-        secret_word_initial = secret_word[0].lower()
-        strategic_words = [w for w in primary_pool if w[0].lower() != secret_word_initial]
+        # Innocents avoid words sharing the secret word's first letter
+        word = get_word_bank("INNOCENT", io).random_word(excluded_words, avoid_initial=secret_word[0])
     else:
-        primary_pool = IMPOSTER_WORDS_POOL
-        strategic_words = primary_pool 
+        word = get_word_bank("IMPOSTER", io).random_word(excluded_words)
         
-    # 2. Try words from the strategic pool first
-    unique_strategic_words = [w for w in strategic_words if w.lower() not in used_words and w.lower() != secret_word_lower]
-    
-    if unique_strategic_words:
-        return random.choice(unique_strategic_words)
+    # 2. Use the strategic word if one is still available
+    if word:
+        return word
 
     # 3. If strategic words are exhausted, fall back to generic words
-    fallback_pool = ["Great", "Cool", "Fun", "Shiny", "New", "Old", "Everyday", "Unique"]
-    unique_fallback_words = [w for w in fallback_pool if w.lower() not in used_words and w.lower() != secret_word_lower]
+    word = get_word_bank("FALLBACK", io).random_word(excluded_words)
 
-    if unique_fallback_words:
-        return random.choice(unique_fallback_words)
+    if word:
+        return word
         
     # 4. Critical failure 
-    print(f"Warning: {player_data['name']} used an emergency fallback word.")
+    io.print(f"Warning: {player_data['name']} used an emergency fallback word.")
     return f"Word{random.randint(100, 999)}" 
 
 
@@ -148,10 +614,11 @@ def generate_ai_vote(players, imposter_index, current_player_index):
         return random.choice(innocent_targets) if innocent_targets else random.choice(available_targets)
 
 
-def end_game(outcome_type, secret_word, imposter_name, human_player_data=None):
+def end_game(outcome_type, secret_word, imposter_name, human_player_data=None, io=None):
     """
     Handles game conclusion and displays final messages, tailored by outcome and human role.
     """
+    io = resolve_console_io(io)
     is_human_imposter = human_player_data and human_player_data['role'] == "IMPOSTER"
     is_human_innocent = human_player_data and human_player_data['role'] == "INNOCENT"
     
@@ -185,35 +652,44 @@ def end_game(outcome_type, secret_word, imposter_name, human_player_data=None):
         elif is_human_innocent:
             message = "CONGRATULATIONS, YOU WIN! The vote was tied, saving the Innocents."
 
-    print("\n" * 3)
-    print("=" * 60)
-    print("--- GAME OVER ---")
-    print(f"\t\t*** {message} ***")
-    print(f"The secret word was: **{secret_word}**")
-    print(f"The Imposter was: **{imposter_name}**")
-    print("=" * 60)
+    io.print("\n" * 3)
+    io.print("=" * 60)
+    io.print("--- GAME OVER ---")
+    io.print(f"\t\t*** {message} ***")
+    io.print(f"The secret word was: **{secret_word}**")
+    io.print(f"The Imposter was: **{imposter_name}**")
+    io.print("=" * 60)
+    io.flush()
     return
 
 
 # --- MODE 1 & 2: CONSOLE GAME (AI Only & MIXED) ---
 
-def start_ai_game():
-    """Starts the console game against only AIs."""
+def start_ai_game(io=None, session=None, checkpoint=None, outcome_store=None):
+    """Starts the console game against only AIs. A GameSession keeps the player name between games."""
+    if session:
+        io = session.io
+    io = resolve_console_io(io)
     
-    print("\n" * 2)
-    print("=" * 60)
-    print("WELCOME TO IMPOSTER: HUMAN VS. AI (SOLO)")
-    print("=" * 60)
+    io.print("\n" * 2)
+    io.print("=" * 60)
+    io.print("WELCOME TO IMPOSTER: HUMAN VS. AI (SOLO)")
+    io.print("=" * 60)
     
     # --- Setup (Uses new dynamic word generator) ---
     num_ai_players = random.randint(3, 5) 
     num_total_players = num_ai_players + 1
     
-    secret_word = get_random_trending_topic()
-    secret_description = get_word_description(secret_word)
+    secret_word, secret_description = get_new_round(io, session)
     imposter_index = random.randint(0, num_total_players - 1)
     
-    human_name = input("Enter your player name: ")
+    if session and session.human_name:
+        human_name = session.human_name
+        io.print(f"Welcome back, {human_name}!")
+    else:
+        human_name = io.input("Enter your player name: ")
+        if session:
+            session.human_name = human_name
     
     all_players_raw = [{'name': f"AI Player {i + 1}", 'type': 'AI'} for i in range(num_ai_players)]
     human_data = {'name': human_name, 'type': 'Human'}
@@ -228,69 +704,104 @@ def start_ai_game():
             human_index = i
             
     # --- Initial Role Reveal ---
-    print("-" * 60)
-    print(f"Game Setup Complete: {len(all_players_raw)} players total.")
-    time.sleep(1)
+    io.print("-" * 60)
+    io.print(f"Game Setup Complete: {len(all_players_raw)} players total.")
+    io.sleep(1)
     
     human_player_data = all_players_raw[human_index]
     
-    print(f"Your role, {human_player_data['name']}, is: **{human_player_data['role']}**")
+    io.print(f"Your role, {human_player_data['name']}, is: **{human_player_data['role']}**")
     if human_player_data['role'] == "INNOCENT":
-        print(f"The SECRET WORD is: **{secret_word}**")
-        print(f"Description: *{secret_description}*") 
-        print(f"Image query for reference: ")
-        print("Tip: Type 'help' during your turn for quick hints about the secret word!") 
+        io.print(f"The SECRET WORD is: **{secret_word}**")
+        io.print(f"Description: *{secret_description}*") 
+        io.print(f"Image query for reference: ")
+        io.print("Tip: Type 'help' during your turn for quick hints about the secret word!") 
     else:
-        print("You are the IMPOSTER. Type 'guess' instead of a word to try and guess the secret word!")
-    print("-" * 60)
-    time.sleep(3)
+        io.print("You are the IMPOSTER. Type 'guess' instead of a word to try and guess the secret word!")
+    io.print("-" * 60)
+    io.sleep(3)
     
-    run_console_game_rounds(all_players_raw, secret_word, imposter_index, human_player_data)
+    run_console_game_rounds(all_players_raw, secret_word, imposter_index, human_player_data, io, checkpoint,
+                            outcome_store=outcome_store)
 
 
-def start_mix_game():
-    """Starts the console game against human players and AIs."""
+def show_private_role(player, secret_word, secret_description, io=None):
+    """Shows one human their role behind a cleared screen, then clears it again for the next player."""
+    io = resolve_console_io(io)
+    io.input(f"Player {player['name']}, press ENTER when you are ready to see your role...")
+    io.clear_screen()
+    io.print("=" * 30)
     
-    print("\n" * 2)
-    print("=" * 60)
-    print("WELCOME TO IMPOSTER: MIXED MODE")
-    print("=" * 60)
+    io.print(f"Your role, {player['name']}, is: **{player['role']}**")
+    if player['role'] == "INNOCENT":
+        io.print(f"The SECRET WORD is: **{secret_word}**")
+        io.print(f"Description: *{secret_description}*") 
+        io.print(f"Image query for reference: ") 
+        io.print("Tip: Type 'help' during your turn for quick hints about the secret word!")
+    else:
+        io.print("You are the IMPOSTER! Type 'guess' instead of a word to try and guess the secret word!")
+        
+    io.print("=" * 30)
+    io.input("Press ENTER to clear screen and pass to the next human player.")
+    io.clear_screen()
+
+
+def start_mix_game(io=None, session=None, checkpoint=None, outcome_store=None):
+    """Starts the console game against human players and AIs. A GameSession keeps the player list between games."""
+    if session:
+        io = session.io
+    io = resolve_console_io(io)
+    
+    io.print("\n" * 2)
+    io.print("=" * 60)
+    io.print("WELCOME TO IMPOSTER: MIXED MODE")
+    io.print("=" * 60)
     
+    if session and session.mix_players:
+        human_names, num_ai_players = session.mix_players
+        num_human_players = len(human_names)
+        io.print(f"Rematch with the same players: {', '.join(human_names)} and {num_ai_players} AI.")
+    else:
+        human_names = None
+
     # Get Human Player and AI counts
-    while True:
+    while human_names is None:
         try:
-            num_human_players = int(input("Enter number of HUMAN players (2 or more): "))
+            num_human_players = int(io.input("Enter number of HUMAN players (2 or more): "))
             if num_human_players < 2:
-                print("Must be 2 or more human players.")
+                io.print("Must be 2 or more human players.")
                 continue
             break
         except ValueError:
-            print("Invalid input.")
+            io.print("Invalid input.")
 
-    while True:
+    while human_names is None:
         try:
-            num_ai_players = int(input("Enter number of AI players (0 or more): "))
+            num_ai_players = int(io.input("Enter number of AI players (0 or more): "))
             if num_ai_players < 0:
-                print("Must be 0 or more AI players.")
+                io.print("Must be 0 or more AI players.")
                 continue
             break
         except ValueError:
-            print("Invalid input.")
+            io.print("Invalid input.")
 
     num_total_players = num_human_players + num_ai_players
     if num_total_players < 3:
-         print("Total players must be 3 or more for a meaningful game. Please try again.")
+         io.print("Total players must be 3 or more for a meaningful game. Please try again.")
+         io.flush()
          return
 
     # --- Setup (Uses new dynamic word generator) ---
-    secret_word = get_random_trending_topic() 
-    secret_description = get_word_description(secret_word)
+    secret_word, secret_description = get_new_round(io, session)
     imposter_index = random.randint(0, num_total_players - 1)
     
     # Build player list
-    human_names = []
-    for i in range(num_human_players):
-        human_names.append(input(f"Enter name for Human Player {i + 1}: "))
+    if human_names is None:
+        human_names = []
+        for i in range(num_human_players):
+            human_names.append(io.input(f"Enter name for Human Player {i + 1}: "))
+        if session:
+            session.mix_players = (human_names, num_ai_players)
     
     all_players_list = []
     for name in human_names:
@@ -309,42 +820,44 @@ def start_mix_game():
     current_human_player = next((p for p in all_players_list if p['type'] == 'Human'), None)
 
     # --- Initial Role Reveal (Fixed) ---
-    print("-" * 60)
-    print(f"Game Setup Complete: {len(all_players_list)} players total ({num_human_players} Human, {num_ai_players} AI).")
-    time.sleep(1)
+    io.print("-" * 60)
+    io.print(f"Game Setup Complete: {len(all_players_list)} players total ({num_human_players} Human, {num_ai_players} AI).")
+    io.sleep(1)
     
-    print("\nRole Reveal Phase (Pass the device for private role check):")
+    io.print("\nRole Reveal Phase (Pass the device for private role check):")
     for i, player in enumerate(all_players_list):
         if player['type'] == 'Human':
-            input(f"Player {player['name']}, press ENTER when you are ready to see your role...")
-            print("\n" * 50) 
-            print("=" * 30)
-            
-            print(f"Your role, {player['name']}, is: **{player['role']}**")
-            if player['role'] == "INNOCENT":
-                print(f"The SECRET WORD is: **{secret_word}**")
-                print(f"Description: *{secret_description}*") 
-                print(f"Image query for reference: ") 
-                print("Tip: Type 'help' during your turn for quick hints about the secret word!")
-            else:
-                print("You are the IMPOSTER! Type 'guess' instead of a word to try and guess the secret word!")
-                
-            print("=" * 30)
-            input("Press ENTER to clear screen and pass to the next human player.")
-            print("\n" * 50) 
+            show_private_role(player, secret_word, secret_description, io)
 
-    print("All human players have seen their roles. Starting game...")
-    print("-" * 60)
-    time.sleep(2)
+    io.print("All human players have seen their roles. Starting game...")
+    io.print("-" * 60)
+    io.sleep(2)
     
-    run_console_game_rounds(all_players_list, secret_word, imposter_index, current_human_player)
+    run_console_game_rounds(all_players_list, secret_word, imposter_index, current_human_player, io, checkpoint,
+                            outcome_store=outcome_store)
 
 
-def run_console_game_rounds(players, secret_word, imposter_index, human_player_data=None):
+def run_console_game_rounds(players, secret_word, imposter_index, human_player_data=None, io=None,
+                            checkpoint=None, restored=None, outcome_store=None):
     """
-    The core loop for AI and MIX modes.
+    The core loop for AI and MIX modes. With a checkpoint, every accepted word
+    and vote is saved; passing a restored state skips the turns already played.
+    With an outcome_store, the result of the game is recorded for analytics.
     """
+    io = resolve_console_io(io)
     all_players_raw = players
+
+    if checkpoint and not restored:
+        checkpoint.start_console_game(all_players_raw, secret_word, imposter_index, human_player_data)
+
+    votes = {}
+
+    def finish_game(outcome_type, imposter_name, human_data=human_player_data):
+        if checkpoint:
+            checkpoint.finish()
+        if outcome_store is not None:
+            outcome_store.record(outcome_type, all_players_raw, imposter_index, secret_word, votes)
+        return end_game(outcome_type, secret_word, imposter_name, human_data, io)
     
     elimination_round = 0
     # The game only goes through one round of descriptions and one vote.
@@ -353,64 +866,78 @@ def run_console_game_rounds(players, secret_word, imposter_index, human_player_d
         
         all_responses = [] 
         used_words = set() 
+        if restored:
+            all_responses = [dict(r) for r in restored['responses']]
+            used_words = {r['response'].lower() for r in all_responses}
+        # Catches other forms of used words ('Streams' after 'Stream') and of the secret
+        used_index = FuzzyIndex(used_words)
+        secret_index = FuzzyIndex([secret_word], TOPIC_ALIASES)
 
         # 1. --- Response Collection (3 Sub-Rounds) ---
         for sub_round in range(1, 4):
+            if sub_round * len(all_players_raw) <= len(all_responses):
+                continue  # Sub-round fully played before a restore
             
-            print(f"\n--- ELIMINATION ROUND {elimination_round}, RESPONSE SUB-ROUND {sub_round}/3 ---")
-            
-            current_sub_round_responses = []
+            io.print(f"\n--- ELIMINATION ROUND {elimination_round}, RESPONSE SUB-ROUND {sub_round}/3 ---")
             
             for i, player in enumerate(all_players_raw):
-                time.sleep(0.5)
+                # Skip turns already played before a restore
+                turn_number = (sub_round - 1) * len(all_players_raw) + i
+                if turn_number < len(all_responses):
+                    continue
+
+                io.sleep(0.5)
                 
                 if player['type'] == 'Human':
-                    print("-" * 30)
-                    print(f"Human Player {player['name']}'s turn (Word {sub_round}):")
+                    io.print("-" * 30)
+                    io.print(f"Human Player {player['name']}'s turn (Word {sub_round}):")
                     valid_input = False
                     response = ""
                     while not valid_input:
-                        raw_input = input("Your ONE-WORD description (or type 'guess' or 'help'): ").strip()
+                        raw_input = io.input("Your ONE-WORD description (or type 'guess' or 'help'): ").strip()
                         
                         # --- Imposter Guess Check ---
                         if raw_input.lower() == "guess":
                             if player['role'] == "IMPOSTER":
-                                guess = input("Imposter, enter your guess for the secret word: ").strip()
+                                guess = io.input("Imposter, enter your guess for the secret word: ").strip()
                                 # HIGHLIGHT GUESS
-                                print(f"**[GUESS] {player['name']} guesses: {guess}**") 
+                                io.print(f"**[GUESS] {player['name']} guesses: {guess}**") 
                                 
-                                if guess.lower() == secret_word.lower():
-                                    return end_game("IMPOSTER_GUESS_WIN", secret_word, player['name'], human_player_data)
+                                if is_correct_guess(guess, secret_word, io):
+                                    return finish_game("IMPOSTER_GUESS_WIN", player['name'])
                                 else:
-                                    print(f"Incorrect guess: {guess}. You must now provide a word description.")
+                                    io.print(f"Incorrect guess: {guess}. You must now provide a word description.")
                                     # Fall through to the regular response logic
                             else:
-                                print("Only the Imposter can use the 'guess' command!")
+                                io.print("Only the Imposter can use the 'guess' command!")
                                 continue
                         
                         # --- Innocent Help Check ---
                         elif raw_input.lower() == "help":
                             if player['role'] == "INNOCENT":
-                                help_words = get_secret_word_help(secret_word)
+                                help_words = get_secret_word_help(secret_word, io)
                                 if help_words:
-                                    print(f"\n*** HINTS: {', '.join(help_words)} ***\n")
+                                    io.print(f"\n*** HINTS: {', '.join(help_words)} ***\n")
                                 else:
-                                    print("\n*** HINTS: No unique words available from the description. ***\n")
-                                print("Now, provide your own unique one-word description.")
+                                    io.print("\n*** HINTS: No unique words available from the description. ***\n")
+                                io.print("Now, provide your own unique one-word description.")
                                 continue # Go back to the start of the while loop to get the actual response
                             else:
-                                print("Only Innocent players can use the 'help' command!")
+                                io.print("Only Innocent players can use the 'help' command!")
                                 continue
 
 
                         response = raw_input 
+                        similar_word = used_index.variant_of(response)
                         
                         if len(response.split()) != 1:
-                            print("Error: You must enter exactly ONE word.")
-                        elif response.lower() == secret_word.lower():
-                             print("Error: You cannot say the secret word!")
+                            io.print("Error: You must enter exactly ONE word.")
+                        elif response.lower() == secret_word.lower() or secret_index.variant_of(response):
+                             io.print("Error: You cannot say the secret word!")
                         elif response.lower() in used_words: 
-                             print(f"Error: The word '{response}' has already been used this round.")
+                             io.print(f"Error: The word '{response}' has already been used this round.")
+                        elif similar_word:
+                             io.print(f"Error: The word '{response}' is too similar to '{similar_word}'.")
                         else:
                             valid_input = True
                             
@@ -418,76 +945,87 @@ def run_console_game_rounds(players, secret_word, imposter_index, human_player_d
                         
                 else: # AI Player
                     # AI does not have the 'guess' or 'help' feature
-                    print(f"AI Player {player['name']}'s turn (Thinking...)")
-                    accepted_response = generate_ai_response(player, secret_word, used_words)
+                    io.print(f"AI Player {player['name']}'s turn (Thinking...)")
+                    accepted_response = generate_ai_response(player, secret_word, used_words, io)
                     
-                    time.sleep(random.uniform(1, 2))
-                    print(f"{player['name']}: {accepted_response}")
+                    io.sleep(random.uniform(1, 2))
+                    io.print(f"{player['name']}: {accepted_response}")
 
                 
                 used_words.add(accepted_response.lower()) 
+                used_index.add(accepted_response.lower())
                 
-                current_sub_round_responses.append({
+                all_responses.append({
                     'name': player['name'], 
                     'response': accepted_response, 
                     'sub_round': sub_round
                 })
-            
-            all_responses.extend(current_sub_round_responses)
+                if checkpoint:
+                    checkpoint.record_response(accepted_response, sub_round)
 
 
         # 2. --- Display All Responses and Vote Collection ---
-        print("\n" * 1)
-        print("=" * 60)
-        print(f"--- VOTING PHASE: ELIMINATION ROUND {elimination_round} ---")
-        print("=" * 60)
+        io.print("\n" * 1)
+        io.print("=" * 60)
+        io.print(f"--- VOTING PHASE: ELIMINATION ROUND {elimination_round} ---")
+        io.print("=" * 60)
         
         # Display all responses from all 3 sub-rounds
-        print("Player Summaries:")
+        io.print("Player Summaries:")
         for i, player in enumerate(all_players_raw):
-            print(f"  [{i+1}] {player['name']}: ", end="")
+            io.print(f"  [{i+1}] {player['name']}: ", end="")
             player_responses = [r['response'] for r in all_responses if r['name'] == player['name']]
-            print(f"Words: {', '.join(player_responses)}")
-        print("-" * 60)
+            io.print(f"Words: {', '.join(player_responses)}")
+        io.print("-" * 60)
         
         # 3. Vote Collection
         votes = {} 
+        already_voted = set()
+        if restored:
+            for voter_index, vote_index in restored['votes']:
+                votes[vote_index] = votes.get(vote_index, 0) + 1
+                already_voted.add(voter_index)
         
         for i, player in enumerate(all_players_raw):
+            if i in already_voted:
+                continue
             vote_index = -1
             if player['type'] == 'Human':
                 # Human vote collection
                 valid_vote = False
                 while not valid_vote:
                     try:
-                        vote = input(f"Player {player['name']}, who do you accuse? Enter player number (1 to {len(all_players_raw)}): ")
+                        vote = io.input(f"Player {player['name']}, who do you accuse? Enter player number (1 to {len(all_players_raw)}): ")
                         vote_index = int(vote) - 1 
                         
                         if 0 <= vote_index < len(all_players_raw) and vote_index != i: 
                             votes[vote_index] = votes.get(vote_index, 0) + 1
                             valid_vote = True
                         else:
-                            print(f"Invalid number, or you cannot vote for yourself ({i+1}).")
+                            io.print(f"Invalid number, or you cannot vote for yourself ({i+1}).")
                     except ValueError:
-                        print("Invalid input.")
+                        io.print("Invalid input.")
             
             else: # AI Vote
                 vote_index = generate_ai_vote(all_players_raw, imposter_index, i)
                 votes[vote_index] = votes.get(vote_index, 0) + 1
+
+            if checkpoint:
+                checkpoint.record_vote(i, vote_index)
         
         # --- Display Vote Breakdown ---
-        print("\n--- VOTE RESULTS ---")
+        io.print("\n--- VOTE RESULTS ---")
         vote_breakdown = []
         for i, player in enumerate(all_players_raw):
             count = votes.get(i, 0)
             vote_breakdown.append(f"[{i+1}] {player['name']}: {count} votes")
         
-        print(f"**Total Votes:** {', '.join(vote_breakdown)}")
-        print("-" * 60)
+        io.print(f"**Total Votes:** {', '.join(vote_breakdown)}")
+        io.print("-" * 60)
                 
         # Determine the outcome of the vote
         if not votes:
-            print("No votes cast! Game continues.") 
+            io.print("No votes cast! Game continues.") 
         
         winning_vote_index = max(votes, key=votes.get)
         max_votes = votes[winning_vote_index]
@@ -495,36 +1033,519 @@ def run_console_game_rounds(players, secret_word, imposter_index, human_player_d
         tied_players = [idx for idx, count in votes.items() if count == max_votes]
         
         if len(tied_players) > 1:
-            print(f"\nVote is a TIE with {max_votes} votes! No one is eliminated.")
+            io.print(f"\nVote is a TIE with {max_votes} votes! No one is eliminated.")
             # If there's a tie, the Imposter failed to rally enough support to get an Innocent out.
-            return end_game("TIED_VOTE_INNOCENT_WIN", secret_word, all_players_raw[imposter_index]['name'], human_player_data)
+            return finish_game("TIED_VOTE_INNOCENT_WIN", all_players_raw[imposter_index]['name'])
 
         accused_player = all_players_raw[winning_vote_index]
         
-        print(f"\nPlayer {winning_vote_index + 1} (**{accused_player['name']}**) was VOTED OUT with {max_votes} votes!")
+        io.print(f"\nPlayer {winning_vote_index + 1} (**{accused_player['name']}**) was VOTED OUT with {max_votes} votes!")
         
         # Check if the Imposter was caught
         if accused_player['role'] == "IMPOSTER":
             # Innocents Win!
             imposter_name = accused_player['name']
-            return end_game("INNOCENT_CAUGHT_WIN", secret_word, imposter_name, human_player_data)
+            return finish_game("INNOCENT_CAUGHT_WIN", imposter_name)
         
         # Imposter not caught (an innocent person was eliminated)
-        print(f"**{accused_player['name']}** was INNOCENT! They are eliminated.")
+        io.print(f"**{accused_player['name']}** was INNOCENT! They are eliminated.")
         
         # Imposter Wins! (They successfully tricked the innocents)
-        return end_game("IMPOSTER_SURVIVED_WIN", secret_word, all_players_raw[imposter_index]['name'], human_player_data)
+        return finish_game("IMPOSTER_SURVIVED_WIN", all_players_raw[imposter_index]['name'])
         
     # If the loop finishes without an outcome (shouldn't happen with the current 1-round rule)
     imposter_name = all_players_raw[imposter_index]['name']
-    return end_game("Game Ended Prematurely.", secret_word, imposter_name)
+    return finish_game("Game Ended Prematurely.", imposter_name, human_data=None)
+
+
+# --- Game Checkpoints (Snapshot and restore of in-progress games) ---
+
+class GameCheckpoint:
+    """
+    Saves an in-progress game to an append-only JSON-lines file. The first line
+    holds the full setup (players, roles, secret word); each later line is one
+    small event (an accepted word, a vote, a GUI turn), so a checkpoint at a
+    turn boundary is a single short append. The file is removed once the game
+    ends.
+    """
+
+    def __init__(self, path=CHECKPOINT_FILE):
+        self.path = path
+        self._file = None
+        self._valid_bytes = None  # Set by load(): where the last complete record ends
+
+    def _write(self, record, mode="a"):
+        if self._file is None or mode == "w":
+            self.close()
+            if mode == "a" and self._valid_bytes is not None:
+                # Drop a torn tail before appending, or the next record would be glued onto it
+                os.truncate(self.path, self._valid_bytes)
+            self._valid_bytes = None
+            self._file = open(self.path, mode, encoding="utf-8")
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._file.flush()
+
+    def start_console_game(self, players, secret_word, imposter_index, human_player_data=None):
+        human_index = next((i for i, p in enumerate(players) if p is human_player_data), None)
+        self._write({'t': 'start', 'mode': 'console', 'players': players, 'secret_word': secret_word,
+                     'imposter_index': imposter_index, 'human_index': human_index}, mode="w")
+
+    def start_gui_game(self, players, secret_word, secret_description, imposter_index):
+        self._write({'t': 'start', 'mode': 'gui', 'players': players, 'secret_word': secret_word,
+                     'secret_description': secret_description, 'imposter_index': imposter_index}, mode="w")
+
+    def record_response(self, response, sub_round):
+        self._write({'t': 'r', 'w': response, 's': sub_round})
+
+    def record_vote(self, voter_index, vote_index):
+        self._write({'t': 'v', 'p': voter_index, 'v': vote_index})
+
+    def record_gui_turn(self, current_player_index):
+        self._write({'t': 'g', 'i': current_player_index})
+
+    def load(self):
+        """Returns the saved game state as a dict, or None if there is no unfinished game."""
+        try:
+            with open(self.path, "rb") as f:
+                lines = f.readlines()
+        except OSError:
+            return None
+
+        state = None
+        valid_bytes = 0
+        for line in lines:
+            # Every record is written with its newline, so a line without one was cut off
+            if not line.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break  # A torn final line from a crash mid-write
+            valid_bytes += len(line)
+            if record['t'] == 'start':
+                state = dict(record, responses=[], votes=[], current_player_index=0)
+                del state['t']
+            elif state is None:
+                break
+            elif record['t'] == 'r':
+                players = state['players']
+                player = players[len(state['responses']) % len(players)]
+                state['responses'].append({'name': player['name'], 'response': record['w'], 'sub_round': record['s']})
+            elif record['t'] == 'v':
+                state['votes'].append((record['p'], record['v']))
+            elif record['t'] == 'g':
+                state['current_player_index'] = record['i']
+        self._valid_bytes = valid_bytes
+        return state
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def finish(self):
+        """Forgets the saved game (it ended normally or the players declined to resume)."""
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+def resume_console_game(checkpoint, state, io=None, outcome_store=None):
+    """Continues an AI or MIX game from a loaded checkpoint state."""
+    io = resolve_console_io(io)
+    players = state['players']
+    human_index = state['human_index']
+    human_player_data = players[human_index] if human_index is not None else None
+
+    io.print("=" * 60)
+    io.print("RESUMING SAVED GAME")
+    io.print("=" * 60)
+    io.print(f"Players: {', '.join(p['name'] for p in players)}")
+
+    # Roles and the secret word were only shown on screen, so show them again privately
+    secret_description = get_word_description(state['secret_word'], io)
+    io.print("\nRole Reveal Phase (Pass the device for private role check):")
+    for player in players:
+        if player['type'] == 'Human':
+            show_private_role(player, state['secret_word'], secret_description, io)
+
+    io.print("Words so far:")
+    for response in state['responses']:
+        io.print(f"  (Word {response['sub_round']}) {response['name']}: {response['response']}")
+    io.print("-" * 60)
+
+    return run_console_game_rounds(players, state['secret_word'], state['imposter_index'],
+                                   human_player_data, io, checkpoint, restored=state, outcome_store=outcome_store)
+
+
+# --- Outcome Store (Columnar game analytics) ---
+
+IMPOSTER_WIN_OUTCOMES = ("IMPOSTER_GUESS_WIN", "IMPOSTER_SURVIVED_WIN")
+
+# Column name -> array typecode. 'I' columns holding strings are dictionary-encoded.
+OUTCOME_COLUMNS = {
+    'outcome_type': 'I',
+    'imposter_won': 'B',
+    'num_players': 'H',
+    'num_humans': 'H',
+    'human_role': 'I',
+    'secret_word': 'I',
+    'votes_for_imposter': 'H',
+    'top_votes': 'H',
+    'total_votes': 'H',
+    'timestamp': 'd',
+}
+OUTCOME_STRING_COLUMNS = ('outcome_type', 'human_role', 'secret_word')
+OUTCOME_GROUP_COLUMNS = ('outcome_type', 'num_players', 'num_humans', 'human_role', 'secret_word')
+OUTCOME_VALUE_COLUMNS = ('imposter_won', 'votes_for_imposter', 'top_votes', 'total_votes')
+
+
+class OutcomeChunk:
+    """
+    One block of finished games stored column by column in typed arrays. Saved
+    chunks also carry per-group totals of the value columns, so aggregate
+    queries merge small summaries instead of rescanning every row.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.columns = {name: array(code) for name, code in OUTCOME_COLUMNS.items()}
+        self.dictionaries = {name: [] for name in OUTCOME_STRING_COLUMNS}
+        self._codes = {name: {} for name in OUTCOME_STRING_COLUMNS}
+        self._summaries = {}
+
+    def append(self, row):
+        self._summaries.clear()
+        for name, value in row.items():
+            if name in self._codes:
+                codes = self._codes[name]
+                if value not in codes:
+                    codes[value] = len(self.dictionaries[name])
+                    self.dictionaries[name].append(value)
+                value = codes[value]
+            self.columns[name].append(value)
+        self.rows += 1
+
+    def values(self, name):
+        """Decodes a column to its Python values (strings for dictionary columns)."""
+        if name in self.dictionaries:
+            lookup = self.dictionaries[name]
+            return [lookup[code] for code in self.columns[name]]
+        return self.columns[name]
+
+    def iter_rows(self):
+        """Yields each stored game as a row dict."""
+        decoded = {name: self.values(name) for name in OUTCOME_COLUMNS}
+        for i in range(self.rows):
+            yield {name: column[i] for name, column in decoded.items()}
+
+    def summary(self, group_by=None):
+        """Returns {group value: [games, sum of each OUTCOME_VALUE_COLUMNS column]}."""
+        if group_by not in self._summaries:
+            if group_by is None:
+                # Collapse any saved grouping into one overall total
+                totals = {None: [sum(column) for column in zip(*self.summary('outcome_type').values())]}
+            else:
+                keys = self.columns[group_by]
+                lookup = self.dictionaries.get(group_by)
+                totals = {}
+                for key, games in Counter(keys).items():
+                    totals[lookup[key] if lookup is not None else key] = [games] + [0] * len(OUTCOME_VALUE_COLUMNS)
+                for i, name in enumerate(OUTCOME_VALUE_COLUMNS, start=1):
+                    # Count (group, value) pairs in C, then weight; value columns are small ints
+                    for (key, value), n in Counter(zip(keys, self.columns[name])).items():
+                        totals[lookup[key] if lookup is not None else key][i] += value * n
+            self._summaries[group_by] = totals
+        return self._summaries[group_by]
+
+    def save(self, path):
+        header = {
+            'rows': self.rows,
+            'byteorder': sys.byteorder,
+            'columns': [[name, code] for name, code in OUTCOME_COLUMNS.items()],
+            'dictionaries': self.dictionaries,
+            'summaries': {name: [[group] + totals for group, totals in self.summary(name).items()]
+                          for name in OUTCOME_GROUP_COLUMNS},
+        }
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(json.dumps(header, separators=(",", ":")).encode("utf-8") + b"\n")
+            for name in OUTCOME_COLUMNS:
+                self.columns[name].tofile(f)
+        os.replace(temp_path, path)  # Readers never see a half-written chunk
+
+    @classmethod
+    def load(cls, path):
+        chunk = cls()
+        with open(path, "rb") as f:
+            header = json.loads(f.readline())
+            chunk.rows = header['rows']
+            for name, code in header['columns']:
+                column = array(code)
+                column.fromfile(f, chunk.rows)
+                if header['byteorder'] != sys.byteorder:
+                    column.byteswap()
+                chunk.columns[name] = column
+        chunk.dictionaries = header['dictionaries']
+        chunk._codes = {name: {v: i for i, v in enumerate(values)} for name, values in chunk.dictionaries.items()}
+        for name, groups in header.get('summaries', {}).items():
+            chunk._summaries[name] = {group[0]: group[1:] for group in groups}
+        return chunk
+
+
+class OutcomeStore:
+    """
+    Appends finished games to columnar chunk files in a directory and answers
+    grouped aggregate queries over them by merging each chunk's group totals.
+
+    Each game is appended to a small JSON-lines tail log as soon as it is
+    recorded, so a crash loses nothing. Once the tail holds chunk_rows games
+    it is compacted into one full columnar chunk, which keeps the number of
+    chunk files (and the cost of a query) proportional to games / chunk_rows.
+    """
+
+    TAIL_NAME = "outcomes-tail.jsonl"
+
+    def __init__(self, directory=OUTCOMES_DIR, chunk_rows=65536):
+        self.directory = directory
+        self.chunk_rows = chunk_rows
+        self._chunks = None      # Saved full chunks, loaded on the first query
+        self._tail = None        # Rows in the tail log, parsed on the first query
+        self._tail_rows = 0
+        self._tail_file = None
+
+    def _tail_path(self):
+        return os.path.join(self.directory, self.TAIL_NAME)
+
+    def record(self, outcome_type, players, imposter_index, secret_word, votes=None):
+        """
+        Adds one finished game; it is on disk as soon as this returns.
+        'human_role' is only set when exactly one human played, since a MIX
+        game with several humans has no single human role to group by.
+        """
+        votes = votes or {}
+        humans = [p for p in players if p['type'] == 'Human']
+        self.append_row({
+            'outcome_type': outcome_type,
+            'imposter_won': 1 if outcome_type in IMPOSTER_WIN_OUTCOMES else 0,
+            'num_players': len(players),
+            'num_humans': len(humans),
+            'human_role': humans[0]['role'] if len(humans) == 1 else "",
+            'secret_word': secret_word,
+            'votes_for_imposter': votes.get(imposter_index, 0),
+            'top_votes': max(votes.values(), default=0),
+            'total_votes': sum(votes.values()),
+            'timestamp': time.time(),
+        })
+
+    def append_row(self, row):
+        self.append_rows([row])
+
+    def append_rows(self, rows):
+        if self._tail_file is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._tail_rows = self._read_tail_log().count(b"\n")
+            self._tail_file = open(self._tail_path(), "a", encoding="utf-8")
+        for row in rows:
+            self._tail_file.write(json.dumps(row, separators=(",", ":")) + "\n")
+            if self._tail is not None:
+                self._tail.append(row)
+        self._tail_file.flush()
+        self._tail_rows += len(rows)
+        if self._tail_rows >= self.chunk_rows:
+            self._compact_tail()
+
+    def _read_tail_log(self):
+        """Returns the tail log's complete lines, cutting off a torn final line first."""
+        try:
+            with open(self._tail_path(), "rb") as f:
+                data = f.read()
+        except OSError:
+            return b""
+        complete = data[:data.rfind(b"\n") + 1]
+        if len(complete) < len(data):
+            # Drop the torn line so the next append starts on a fresh line
+            os.truncate(self._tail_path(), len(complete))
+        return complete
+
+    def _load_tail(self):
+        if self._tail is None:
+            self._tail = OutcomeChunk()
+            for line in self._read_tail_log().splitlines():
+                try:
+                    self._tail.append(json.loads(line))
+                except (ValueError, KeyError):
+                    continue
+        return self._tail
+
+    def _compact_tail(self):
+        """Turns the tail log into a full columnar chunk and starts an empty tail."""
+        self._load_tail()
+        self.flush()
+        path = os.path.join(self.directory, f"outcomes-{time.time_ns()}-{os.getpid()}.chunk")
+        self._tail.save(path)
+        os.remove(self._tail_path())
+        if self._chunks is not None:
+            self._chunks.append((path, self._tail))
+        self._tail = OutcomeChunk()
+        self._tail_rows = 0
+
+    def flush(self):
+        """Closes the tail log. Rows are already on disk, so this only releases the file."""
+        if self._tail_file is not None:
+            self._tail_file.close()
+            self._tail_file = None
+
+    def _all_chunks(self):
+        if self._chunks is None:
+            paths = sorted(glob.glob(os.path.join(self.directory, "outcomes-*.chunk")))
+            self._chunks = [(path, OutcomeChunk.load(path)) for path in paths]
+
+            # Fold any partial chunks (e.g. from older versions) back into the tail
+            small = [(path, chunk) for path, chunk in self._chunks if chunk.rows < self.chunk_rows]
+            if small:
+                self._chunks = [entry for entry in self._chunks if entry[1].rows >= self.chunk_rows]
+                self.append_rows([row for _, chunk in small for row in chunk.iter_rows()])
+                for path, _ in small:
+                    os.remove(path)
+
+        tail = self._load_tail()
+        return [chunk for _, chunk in self._chunks] + ([tail] if tail.rows else [])
+
+    def __len__(self):
+        return sum(chunk.rows for chunk in self._all_chunks())
+
+    def _grouped_totals(self, group_by):
+        if group_by is not None and group_by not in OUTCOME_GROUP_COLUMNS:
+            raise ValueError(f"Cannot group outcomes by: {group_by}")
+        totals = {}
+        for chunk in self._all_chunks():
+            for group, chunk_totals in chunk.summary(group_by).items():
+                entry = totals.setdefault(group, [0] * len(chunk_totals))
+                for i, value in enumerate(chunk_totals):
+                    entry[i] += value
+        return totals
+
+    def win_rates(self, group_by=None):
+        """
+        Imposter win rate per value of group_by (one of OUTCOME_GROUP_COLUMNS),
+        or overall when group_by is None.
+        For 'human_role', the human's own win rate is 1 - rate for INNOCENT rows;
+        games without exactly one human are grouped under "".
+        """
+        results = {}
+        for group, (games, imposter_wins, _, _, _) in self._grouped_totals(group_by).items():
+            results[group] = {
+                'games': games,
+                'imposter_wins': imposter_wins,
+                'imposter_win_rate': imposter_wins / games,
+            }
+        return results
+
+    def vote_stats(self, group_by=None):
+        """Average vote distribution per value of group_by, or overall when group_by is None."""
+        results = {}
+        for group, (games, _, for_imposter, top, total) in self._grouped_totals(group_by).items():
+            results[group] = {
+                'games': games,
+                'mean_votes_for_imposter': for_imposter / games,
+                'mean_top_votes': top / games,
+                'imposter_vote_share': for_imposter / total if total else 0.0,
+                'top_vote_share': top / total if total else 0.0,
+            }
+        return results
+
+
+def show_outcome_stats(outcome_store, io=None):
+    """Prints win rates and vote stats from the outcome store."""
+    io = resolve_console_io(io)
+    if not len(outcome_store):
+        io.print("No finished games have been recorded yet.")
+        io.flush()
+        return
+
+    io.print("=" * 60)
+    io.print("--- GAME STATS ---")
+    for group_by in ('outcome_type', 'num_players', 'human_role'):
+        io.print(f"Imposter win rate by {group_by}:")
+        rates = outcome_store.win_rates(group_by)
+        for group in sorted(rates, key=str):
+            stats = rates[group]
+            io.print(f"  {group or '(not one human)'}: {stats['imposter_win_rate']:.1%} of {stats['games']} games")
+    overall = outcome_store.vote_stats()[None]
+    io.print(f"Votes on the imposter: {overall['imposter_vote_share']:.1%} of all votes cast")
+    io.print("=" * 60)
+    io.flush()
+
+
+# --- Warm Game Session (Rematches without reloading) ---
+
+class GameSession:
+    """
+    Keeps players, word banks and cached descriptions alive across games, and
+    fetches the next round's secret word and description in the background
+    while the current game is being played.
+    """
+
+    def __init__(self, io=None):
+        self.io = resolve_console_io(io)
+        self.human_name = None    # AI mode player name
+        self.mix_players = None   # MIX mode (human_names, num_ai_players)
+        self.games_played = 0
+
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._warm_up = self._executor.submit(self._warm_word_banks)
+        self._next_round = self._executor.submit(self._prepare_round)
+
+    def _warm_word_banks(self):
+        # Load errors are worth showing, but the worker thread must not write into the
+        # console's frame; they are collected here and shown by next_round() instead
+        messages = StringIO()
+        quiet_io = ConsoleIO(writer=messages)
+        for name in ("INNOCENT", "IMPOSTER", "FALLBACK"):
+            get_word_bank(name, quiet_io)
+        quiet_io.flush()
+        return messages.getvalue()
+
+    def _prepare_round(self):
+        # Background fetches must not write into the game's screen
+        quiet_io = ConsoleIO(writer=StringIO())
+        secret_word = get_random_trending_topic(quiet_io)
+        return secret_word, get_word_description(secret_word, quiet_io)
+
+    def next_round(self):
+        """Returns (secret_word, description) for a new game and starts preparing the one after."""
+        if self._warm_up is not None:
+            messages = self._warm_up.result()
+            self._warm_up = None
+            if messages:
+                self.io.print(messages, end="")
+        prepared = self._next_round.result()
+        self._next_round = self._executor.submit(self._prepare_round)
+        self.games_played += 1
+        return prepared
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_new_round(io=None, session=None):
+    """Returns (secret_word, description), taken from the session's prefetch when there is one."""
+    if session:
+        return session.next_round()
+    secret_word = get_random_trending_topic(io)
+    return secret_word, get_word_description(secret_word, io)
 
 
 # --- MODE 3: MULTI-PLAYER (Graphical User Interface) ---
 
 class ImposterGameGUI:
-    def __init__(self, master):
+    def __init__(self, master, session=None, checkpoint=None, saved_game=None):
         self.master = master
+        self.session = session
+        self.checkpoint = checkpoint
         master.title("Imposter Word Game (Player Mode)")
         
         # --- GUI FIX: Enable resizing/fullscreen and set min size ---
@@ -543,7 +1564,20 @@ class ImposterGameGUI:
         # Remove any previous bindings before setting up the first screen
         self.master.unbind('<Return>')
         
-        self.setup_player_count_screen()
+        if saved_game:
+            self.resume_saved_game(saved_game)
+        else:
+            self.setup_player_count_screen()
+
+    def resume_saved_game(self, saved_game):
+        # Pick up the role reveal where the checkpoint left off
+        self.player_data = saved_game['players']
+        self.num_players = len(self.player_data)
+        self.secret_word = saved_game['secret_word']
+        self.secret_description = saved_game['secret_description']
+        self.imposter_index = saved_game['imposter_index']
+        self.current_player_index = saved_game['current_player_index']
+        self.show_next_player_click_screen()
 
     # Helper function to process ENTER key bind for player count
     def bind_player_count_enter(self, event):
@@ -601,8 +1635,7 @@ class ImposterGameGUI:
             return
 
         # --- Dynamic Word Generation for GUI Mode ---
-        self.secret_word = get_random_trending_topic()
-        self.secret_description = get_word_description(self.secret_word)
+        self.secret_word, self.secret_description = get_new_round(session=self.session)
         self.imposter_index = random.randint(0, self.num_players - 1)
         self.player_data = [] 
         self.current_setup_player = 0
@@ -659,6 +1692,8 @@ class ImposterGameGUI:
 
     def start_player_turns(self):
         self.current_player_index = 0
+        if self.checkpoint:
+            self.checkpoint.start_gui_game(self.player_data, self.secret_word, self.secret_description, self.imposter_index)
         self.show_next_player_click_screen()
 
     def show_next_player_click_screen(self):
@@ -731,6 +1766,8 @@ class ImposterGameGUI:
         # Unbind the ENTER key before changing screens
         self.master.unbind('<Return>')
         self.current_player_index += 1
+        if self.checkpoint:
+            self.checkpoint.record_gui_turn(self.current_player_index)
         self.show_next_player_click_screen()
 
     def show_end_game_screen(self):
@@ -754,6 +1791,8 @@ class ImposterGameGUI:
     def reveal_results(self):
         self.master.unbind('<Return>')
         self.clear_frame()
+        if self.checkpoint:
+            self.checkpoint.finish()
         
         # Use a main frame to contain content and allow expansion
         main_frame = tk.Frame(self.master)
@@ -771,7 +1810,16 @@ class ImposterGameGUI:
         tk.Label(main_frame, text="The Imposter was:", font=('Arial', 16)).pack(pady=20)
         tk.Label(main_frame, text=f"**{imposter_data['name']}**", font=('Arial', 36, 'bold'), fg='red').pack(pady=5)
 
-        tk.Button(main_frame, text="Play Again", command=self.setup_player_count_screen, font=('Arial', 14)).pack(pady=30)
+        tk.Button(main_frame, text="Rematch (Same Players)", command=self.start_rematch, font=('Arial', 14)).pack(pady=(30, 5))
+        tk.Button(main_frame, text="Play Again", command=self.setup_player_count_screen, font=('Arial', 14)).pack(pady=5)
+
+    def start_rematch(self):
+        # Keep the same names, pick a new word (prefetched by the session) and a new imposter
+        self.secret_word, self.secret_description = get_new_round(session=self.session)
+        self.imposter_index = random.randint(0, self.num_players - 1)
+        for i, player in enumerate(self.player_data):
+            player['role'] = "IMPOSTER" if i == self.imposter_index else "INNOCENT"
+        self.start_player_turns()
 
     def clear_frame(self):
         for widget in self.master.winfo_children():
@@ -783,21 +1831,55 @@ class ImposterGameGUI:
 def main():
     """Prompts user for input mode and starts the corresponding game."""
     print("Welcome to the Imposter Word Game!")
-    mode = input('Enter "AI", "PLAYER", or "MIX" to choose the game mode: ').strip().upper()
 
-    if mode == "AI":
-        start_ai_game()
-    elif mode == "MIX":
-        start_mix_game()
+    outcome_store = OutcomeStore()
+    atexit.register(outcome_store.flush)
+
+    # --- Offer to resume a game that was cut off ---
+    checkpoint = GameCheckpoint()
+    saved_game = checkpoint.load()
+    mode = None
+    if saved_game:
+        resume = input("An unfinished game was found. Resume it? (y/n): ").strip().lower()
+        if resume in ("y", "yes"):
+            if saved_game['mode'] == 'console':
+                resume_console_game(checkpoint, saved_game, outcome_store=outcome_store)
+                return
+            mode = "PLAYER"
+        else:
+            checkpoint.finish()
+            saved_game = None
+
+    if mode is None:
+        mode = input('Enter "AI", "PLAYER", "MIX", or "STATS" to choose the game mode: ').strip().upper()
+
+    if mode in ("AI", "MIX"):
+        # Keep one session so rematches reuse players and the prefetched word
+        session = GameSession()
+        play_game = start_ai_game if mode == "AI" else start_mix_game
+        try:
+            while True:
+                play_game(session=session, checkpoint=checkpoint, outcome_store=outcome_store)
+                again = session.io.input("Play again with the same players? (y/n): ").strip().lower()
+                if again not in ("y", "yes"):
+                    break
+        finally:
+            session.close()
+        print("Goodbye!")
+    elif mode == "STATS":
+        show_outcome_stats(outcome_store)
     elif mode == "PLAYER":
+        session = GameSession()
         try:
             root = tk.Tk()
-            ImposterGameGUI(root)
+            ImposterGameGUI(root, session, checkpoint, saved_game)
             root.mainloop()
         except Exception as e:
             print(f"\n--- FATAL ERROR IN PLAYER MODE (GUI) ---\n")
             print("Ensure tkinter is installed and accessible.")
             print(f"Error details: {e}")
+        finally:
+            session.close()
     else:
         print("Goodbye!")
 
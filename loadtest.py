@@ -0,0 +1,248 @@
+import argparse
+import random
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from MYGAME import ConsoleIO, start_mix_game
+
+# --- Scripted I/O Load Test for MIX Mode ---
+
+BOT_VOCABULARY = [
+    "Bright", "Quick", "Famous", "Loud", "Smooth", "Sweet", "Heavy", "Urban",
+    "Retro", "Sharp", "Classic", "Fresh", "Daily", "Simple", "Royal", "Warm",
+]
+
+BOT_GUESSES = ["Tesla", "Netflix", "ChatGPT", "Fortnite", "Starbucks", "Disney", "Amazon"]
+
+# Validation messages printed by run_console_game_rounds, keyed by short label
+DESCRIPTION_ERRORS = {
+    "one_word": "You must enter exactly ONE word",
+    "secret_word": "You cannot say the secret word",
+    "already_used": "has already been used this round",
+    "too_similar": "is too similar to",
+}
+
+VOTE_ERRORS = {
+    "bad_vote": "Invalid number, or you cannot vote for yourself",
+    "bad_number": "Invalid input.",
+}
+
+VALIDATION_ERRORS = {**DESCRIPTION_ERRORS, **VOTE_ERRORS}
+
+
+class ScriptedHumanBot:
+    """
+    A reader/writer stream pair that plays every human seat of one MIX game.
+    It reads the game's prompts from what gets written and answers them with a
+    mix of valid words, 'help', 'guess', invalid entries and votes.
+    """
+
+    def __init__(self, num_humans, num_ai, rng, mistake_rate=0.2):
+        self.num_humans = num_humans
+        self.num_ai = num_ai
+        self.rng = rng
+        self.mistake_rate = mistake_rate
+
+        self._pending = ""
+        self.secret_word = None
+        self.typed_words = []
+        self.seats = {}  # player name -> seat number, from the 'Player Summaries' listing
+
+        self.latencies = []
+        self.description_attempts = 0
+        self.vote_attempts = 0
+        self.errors = {label: 0 for label in VALIDATION_ERRORS}
+        self._last_reply_at = None
+
+    # -- Writer side --
+    def write(self, text):
+        self._pending += text
+        while "\n" in self._pending:
+            line, self._pending = self._pending.split("\n", 1)
+            self._observe(line)
+
+    def flush(self):
+        pass
+
+    def _observe(self, line):
+        match = re.search(r"The SECRET WORD is: \*\*(.+)\*\*", line)
+        if match:
+            self.secret_word = match.group(1)
+        match = re.match(r"\s*\[(\d+)\] (.+?): Words:", line)
+        if match:
+            self.seats[match.group(2)] = int(match.group(1))
+        for label, message in VALIDATION_ERRORS.items():
+            if message in line:
+                self.errors[label] += 1
+
+    # -- Reader side --
+    def readline(self):
+        now = time.perf_counter()
+        if self._last_reply_at is not None:
+            self.latencies.append(now - self._last_reply_at)
+
+        prompt, self._pending = self._pending, ""
+        answer = self._answer(prompt)
+
+        self._last_reply_at = time.perf_counter()
+        return answer + "\n"
+
+    def _answer(self, prompt):
+        if "number of HUMAN players" in prompt:
+            return str(self.num_humans)
+        if "number of AI players" in prompt:
+            return str(self.num_ai)
+        match = re.search(r"Enter name for Human Player (\d+)", prompt)
+        if match:
+            return f"Bot{match.group(1)}"
+        if "press ENTER" in prompt or "Press ENTER" in prompt:
+            return ""
+        if "ONE-WORD description" in prompt:
+            self.description_attempts += 1
+            return self._description()
+        if "enter your guess" in prompt:
+            return self.rng.choice(BOT_GUESSES)
+        match = re.search(r"Player (.+), who do you accuse\? Enter player number \(1 to (\d+)\)", prompt)
+        if match:
+            self.vote_attempts += 1
+            num_players = int(match.group(2))
+            if self.rng.random() < self.mistake_rate:
+                return self.rng.choice(["abc", "0", str(num_players + 1)])
+            own_seat = self.seats.get(match.group(1))
+            return str(self.rng.choice([seat for seat in range(1, num_players + 1) if seat != own_seat]))
+        raise RuntimeError(f"Scripted bot does not understand prompt: {prompt!r}")
+
+    def _description(self):
+        roll = self.rng.random()
+        if roll < self.mistake_rate / 5:
+            return "two words"
+        if roll < self.mistake_rate * 2 / 5 and self.typed_words:
+            return self.rng.choice(self.typed_words)
+        if roll < self.mistake_rate * 3 / 5 and self.secret_word and len(self.secret_word.split()) == 1:
+            return self.secret_word
+        if roll < self.mistake_rate * 4 / 5:
+            return "help"
+        if roll < self.mistake_rate:
+            return "guess"
+        word = f"{self.rng.choice(BOT_VOCABULARY)}{self.rng.randint(1, 99)}"
+        while word in self.typed_words:
+            word = f"{self.rng.choice(BOT_VOCABULARY)}{self.rng.randint(1, 99)}"
+        self.typed_words.append(word)
+        return word
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_load_test(num_games=200, concurrency=8, num_humans=3, num_ai=2, mistake_rate=0.2, seed=None):
+    """
+    Plays num_games MIX games across concurrency worker threads with scripted
+    human bots and returns a dict of throughput, latency and error statistics.
+
+    The game itself draws from the shared module-level random generator, so a
+    seed only makes runs repeatable if games do not interleave: seeded games
+    reseed that generator and run one at a time (concurrency is then ignored).
+    """
+    seed_rng = random.Random(seed)
+    seeds = [seed_rng.random() for _ in range(num_games)]
+    bots = [None] * num_games
+    crashes = []
+    lock = threading.Lock()
+    game_lock = threading.Lock() if seed is not None else None
+
+    def play_game(bot):
+        io = ConsoleIO(reader=bot, writer=bot, sleep=lambda seconds: None)
+        try:
+            start_mix_game(io)
+        except Exception as e:
+            with lock:
+                crashes.append(repr(e))
+
+    def play(index):
+        bot = ScriptedHumanBot(num_humans, num_ai, random.Random(seeds[index]), mistake_rate)
+        if game_lock is None:
+            play_game(bot)
+        else:
+            with game_lock:
+                random.seed(seeds[index])
+                play_game(bot)
+        bots[index] = bot
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency if game_lock is None else 1) as pool:
+        list(pool.map(play, range(num_games)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(l for bot in bots for l in bot.latencies)
+    attempts = sum(bot.description_attempts for bot in bots)
+    vote_attempts = sum(bot.vote_attempts for bot in bots)
+    errors = {label: sum(bot.errors[label] for bot in bots) for label in VALIDATION_ERRORS}
+
+    return {
+        "games": num_games,
+        "seconds": elapsed,
+        "games_per_second": num_games / elapsed if elapsed else 0.0,
+        "turn_latency_ms": {
+            "p50": _percentile(latencies, 0.50) * 1000,
+            "p90": _percentile(latencies, 0.90) * 1000,
+            "p99": _percentile(latencies, 0.99) * 1000,
+            "max": (latencies[-1] * 1000) if latencies else 0.0,
+        },
+        "description_attempts": attempts,
+        "vote_attempts": vote_attempts,
+        "validation_errors": errors,
+        "validation_error_rate": {
+            label: (count / total if total else 0.0)
+            for label, count in errors.items()
+            for total in [attempts if label in DESCRIPTION_ERRORS else vote_attempts]
+        },
+        "crashes": crashes,
+    }
+
+
+def print_report(report):
+    """Prints a load test report in the same banner style as the game."""
+    print("=" * 60)
+    print("--- MIX MODE LOAD TEST ---")
+    print(f"Games played: {report['games']} in {report['seconds']:.2f}s "
+          f"({report['games_per_second']:.1f} games/sec)")
+    latency = report["turn_latency_ms"]
+    print(f"Turn latency (ms): p50={latency['p50']:.3f} p90={latency['p90']:.3f} "
+          f"p99={latency['p99']:.3f} max={latency['max']:.3f}")
+    print(f"Description attempts: {report['description_attempts']}, "
+          f"vote attempts: {report['vote_attempts']}")
+    for label, count in report["validation_errors"].items():
+        rate = report["validation_error_rate"][label]
+        kind = "description" if label in DESCRIPTION_ERRORS else "vote"
+        print(f"  {label}: {count} ({rate:.1%} of {kind} attempts)")
+    print(f"Crashed games: {len(report['crashes'])}")
+    for crash in report["crashes"][:5]:
+        print(f"  {crash}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Drive many scripted MIX games at once.")
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--humans", type=int, default=3)
+    parser.add_argument("--ai", type=int, default=2)
+    parser.add_argument("--mistake-rate", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=None,
+                        help="make the run repeatable; seeded games run one at a time")
+    parser.add_argument("--strict", action="store_true",
+                        help="exit non-zero on any validation error or crash (use with --mistake-rate 0)")
+    args = parser.parse_args()
+
+    report = run_load_test(args.games, args.concurrency, args.humans, args.ai,
+                           args.mistake_rate, args.seed)
+    print_report(report)
+    if args.strict and (any(report["validation_errors"].values()) or report["crashes"]):
+        sys.exit("Strict mode: the scripted bots hit validation errors or crashes.")